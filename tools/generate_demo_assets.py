@@ -6,7 +6,11 @@ project/demos/. Run once to populate project/assets/. Generated files are
 committed to the repo so cloning works without running this script.
 
 Usage:
-    python tools/generate_demo_assets.py
+    python tools/generate_demo_assets.py            # regenerate stale assets
+    python tools/generate_demo_assets.py --force    # regenerate everything
+
+Each output gets a sidecar <file>.stamp holding a hash of the generator
+parameters and of this script; assets whose stamp still matches are skipped.
 
 Output:
     project/assets/meshes/uv_sphere.obj          — 32×16 UV sphere with normals + UVs
@@ -18,72 +22,120 @@ Output:
     project/assets/environments/gradient_sky.hdr  — 512×256 gradient panorama (Radiance HDR)
 """
 
+import argparse
+import functools
+import hashlib
+import inspect
 import math
-import os
 import struct
 import zlib
+from pathlib import Path
 
 # ============================================================
 # Configuration
 # ============================================================
 
-ASSETS_ROOT = os.path.join(os.path.dirname(__file__), "..", "project", "assets")
-MESHES_DIR = os.path.join(ASSETS_ROOT, "meshes")
-TEXTURES_DIR = os.path.join(ASSETS_ROOT, "textures")
-ENVS_DIR = os.path.join(ASSETS_ROOT, "environments")
+# Resolved once at import; callers join filenames with "/".
+ASSETS_ROOT = Path(__file__).resolve().parent.parent / "project" / "assets"
+MESHES_DIR = ASSETS_ROOT / "meshes"
+TEXTURES_DIR = ASSETS_ROOT / "textures"
+ENVS_DIR = ASSETS_ROOT / "environments"
 
 
 def ensure_dirs():
     for d in [MESHES_DIR, TEXTURES_DIR, ENVS_DIR]:
-        os.makedirs(d, exist_ok=True)
+        d.mkdir(parents=True, exist_ok=True)
+
+
+# ============================================================
+# Output caching
+# ============================================================
+
+# Any edit to this script changes every stamp, so generator changes are
+# never masked by a stale cache.
+_SCRIPT_DIGEST = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
+
+
+def _cached_output(generate):
+    """Skip a generate_*(filepath, ...) call whose output is already current.
+
+    The stamp key hashes the generator name, its fully bound parameters and
+    this script. Pass force=True to regenerate regardless.
+    """
+    signature = inspect.signature(generate)
+
+    @functools.wraps(generate)
+    def wrapper(filepath, *args, force=False, **kwargs):
+        bound = signature.bind(filepath, *args, **kwargs)
+        bound.apply_defaults()
+        params = sorted((k, v) for k, v in bound.arguments.items() if k != "filepath")
+        key = hashlib.blake2b(
+            _SCRIPT_DIGEST + repr((generate.__name__, params)).encode(),
+            digest_size=16,
+        ).hexdigest()
+
+        output = Path(filepath)
+        stamp_path = output.with_name(output.name + ".stamp")
+        if not force and output.exists():
+            try:
+                if stamp_path.read_text() == key:
+                    print(f"  Up to date {filepath}")
+                    return
+            except OSError:
+                pass
+
+        generate(filepath, *args, **kwargs)
+        stamp_path.write_text(key)
+
+    return wrapper
 
 
 # ============================================================
 # OBJ mesh generators
 # ============================================================
 
+@_cached_output
 def generate_uv_sphere(filepath, slices=32, stacks=16, radius=1.0):
     """Generate a UV sphere with normals and texture coordinates."""
     verts = []     # (x, y, z)
     normals = []   # (nx, ny, nz)
     uvs = []       # (u, v)
-    faces = []     # list of (v/vt/vn, v/vt/vn, v/vt/vn)
+
+    # Theta only depends on the slice index — evaluate its trig once into an
+    # interleaved (sin, cos) table so each pair is fetched together.
+    sincos_theta = [
+        (math.sin(t), math.cos(t))
+        for t in (2.0 * math.pi * i / slices for i in range(slices + 1))
+    ]
 
     # Generate vertices.
     for j in range(stacks + 1):
         phi = math.pi * j / stacks
-        for i in range(slices + 1):
-            theta = 2.0 * math.pi * i / slices
-            x = radius * math.sin(phi) * math.cos(theta)
-            y = radius * math.cos(phi)
-            z = radius * math.sin(phi) * math.sin(theta)
-            nx, ny, nz = _normalize(x, y, z)
+        sin_phi, cos_phi = math.sin(phi), math.cos(phi)
+        for i, (sin_t, cos_t) in enumerate(sincos_theta):
+            x = radius * sin_phi * cos_t
+            y = radius * cos_phi
+            z = radius * sin_phi * sin_t
+            # Unit sphere position is already the unit normal — no sqrt needed.
+            nx, ny, nz = sin_phi * cos_t, cos_phi, sin_phi * sin_t
             u = i / slices
             v = j / stacks
             verts.append((x, y, z))
             normals.append((nx, ny, nz))
             uvs.append((u, v))
 
-    # Generate faces (quads split into two triangles).
-    for j in range(stacks):
-        for i in range(slices):
-            a = j * (slices + 1) + i + 1        # 1-indexed
-            b = j * (slices + 1) + (i + 1) + 1
-            c = (j + 1) * (slices + 1) + (i + 1) + 1
-            d = (j + 1) * (slices + 1) + i + 1
-            faces.append((a, b, c))
-            faces.append((a, c, d))
+    faces = _grid_faces(slices, stacks)
 
     _write_obj(filepath, "UVSphere", verts, normals, uvs, faces)
     print(f"  Generated {filepath} ({len(verts)} verts, {len(faces)} tris)")
 
 
+@_cached_output
 def generate_subdivided_plane(filepath, subdivisions=8, size=4.0):
     """Generate a subdivided XZ plane centered at origin, facing +Y."""
     verts = []
     normals = []
     uvs = []
-    faces = []
 
     half = size / 2.0
     for j in range(subdivisions + 1):
@@ -96,37 +148,51 @@ def generate_subdivided_plane(filepath, subdivisions=8, size=4.0):
             normals.append((0.0, 1.0, 0.0))
             uvs.append((u, v))
 
-    for j in range(subdivisions):
-        for i in range(subdivisions):
-            a = j * (subdivisions + 1) + i + 1
-            b = a + 1
-            c = b + (subdivisions + 1)
-            d = a + (subdivisions + 1)
-            faces.append((a, b, c))
-            faces.append((a, c, d))
+    faces = _grid_faces(subdivisions, subdivisions)
 
     _write_obj(filepath, "SubdividedPlane", verts, normals, uvs, faces)
     print(f"  Generated {filepath} ({len(verts)} verts, {len(faces)} tris)")
 
 
+def _grid_faces(cols, rows):
+    """Triangulate a row-major (cols+1)×(rows+1) vertex grid.
+
+    Returns two triangles per grid cell in _write_obj's face format. Grid
+    meshes store one position, normal and UV per vertex, so each corner
+    uses the same 1-indexed v/vt/vn index.
+    """
+    stride = cols + 1
+    faces = []
+    for j in range(rows):
+        row_start = j * stride + 1
+        for v in range(row_start, row_start + cols):
+            a = (v, v, v)
+            b = (v + 1,) * 3
+            c = (v + stride + 1,) * 3  # diagonal corner of the cell
+            d = (v + stride,) * 3
+            faces.append((a, b, c))
+            faces.append((a, c, d))
+    return faces
+
+
+@_cached_output
 def generate_room_box(filepath, width=8.0, height=4.0, depth=8.0):
     """Generate an open-front box (floor + 3 walls + ceiling), for lighting demo."""
     verts = []
     normals = []
     uvs = []
     faces = []
-    idx = [0]  # mutable counter for 1-indexed faces
 
     def add_quad(v0, v1, v2, v3, n):
-        """Add a quad (two triangles) with shared normal."""
-        base = idx[0] + 1
-        for v in [v0, v1, v2, v3]:
-            verts.append(v)
-            normals.append(n)
+        """Add a quad (two triangles) whose corners share a single normal."""
+        base = len(verts) + 1       # 1-indexed; uvs stay in step with verts
+        verts.extend([v0, v1, v2, v3])
         uvs.extend([(0, 0), (1, 0), (1, 1), (0, 1)])
-        faces.append((base, base + 1, base + 2))
-        faces.append((base, base + 2, base + 3))
-        idx[0] += 4
+        normals.append(n)
+        vn = len(normals)
+        c0, c1, c2, c3 = ((base + k, base + k, vn) for k in range(4))
+        faces.append((c0, c1, c2))
+        faces.append((c0, c2, c3))
 
     hw, hh, hd = width / 2, height, depth / 2
 
@@ -145,63 +211,85 @@ def generate_room_box(filepath, width=8.0, height=4.0, depth=8.0):
     print(f"  Generated {filepath} ({len(verts)} verts, {len(faces)} tris)")
 
 
-def _normalize(x, y, z):
-    length = math.sqrt(x * x + y * y + z * z)
-    if length < 1e-10:
-        return (0.0, 1.0, 0.0)
-    return (x / length, y / length, z / length)
-
-
 def _write_obj(filepath, obj_name, verts, normals, uvs, faces):
-    """Write a Wavefront OBJ file with combined v/vn/vt indices (all same)."""
-    with open(filepath, "w") as f:
-        f.write(f"# {os.path.basename(filepath)} — Generated by tools/generate_demo_assets.py\n")
-        f.write(f"o {obj_name}\n\n")
-        for v in verts:
-            f.write(f"v {v[0]:.6f} {v[1]:.6f} {v[2]:.6f}\n")
-        f.write("\n")
-        for vn in normals:
-            f.write(f"vn {vn[0]:.6f} {vn[1]:.6f} {vn[2]:.6f}\n")
-        f.write("\n")
-        for vt in uvs:
-            f.write(f"vt {vt[0]:.6f} {vt[1]:.6f}\n")
-        f.write("\n")
-        for tri in faces:
-            a, b, c = tri
-            f.write(f"f {a}/{a}/{a} {b}/{b}/{b} {c}/{c}/{c}\n")
+    """Write a Wavefront OBJ file.
+
+    Each face is a triangle of three (v, vt, vn) corners, 1-indexed into
+    verts, uvs and normals respectively.
+    """
+    # Assemble the whole file in memory and emit it with a single write.
+    parts = [
+        f"# {Path(filepath).name} — Generated by tools/generate_demo_assets.py\n",
+        f"o {obj_name}\n\n",
+    ]
+    # printf-style % formatting takes CPython's C fast path for floats.
+    parts.extend("v %.6f %.6f %.6f\n" % v for v in verts)
+    parts.append("\n")
+    parts.extend("vn %.6f %.6f %.6f\n" % vn for vn in normals)
+    parts.append("\n")
+    parts.extend("vt %.6f %.6f\n" % vt for vt in uvs)
+    parts.append("\n")
+    parts.extend("f %d/%d/%d %d/%d/%d %d/%d/%d\n" % (a + b + c) for a, b, c in faces)
+
+    Path(filepath).write_text("".join(parts))
 
 
 # ============================================================
 # Texture generators (raw PNG without PIL)
 # ============================================================
 
+def _png_chunk(chunk_type, data):
+    """Frame one PNG chunk: length, type, data, CRC."""
+    # CRC covers type + data; chain it rather than concatenating a copy.
+    crc = zlib.crc32(data, zlib.crc32(chunk_type)) & 0xFFFFFFFF
+    return b"".join((struct.pack(">I", len(data)), chunk_type, data, struct.pack(">I", crc)))
+
+
+def _write_png_file(filepath, width, height, idat_data):
+    """Write an 8-bit RGB PNG around an already-compressed IDAT payload."""
+    ihdr_data = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    signature = b"\x89PNG\r\n\x1a\n"
+    ihdr_chunk = _png_chunk(b"IHDR", ihdr_data)
+    idat_chunk = _png_chunk(b"IDAT", idat_data)
+    iend_chunk = _png_chunk(b"IEND", b"")
+    Path(filepath).write_bytes(signature + ihdr_chunk + idat_chunk + iend_chunk)
+
+
 def _write_png(filepath, width, height, pixels_rgb):
-    """Write a minimal 8-bit RGB PNG from a flat list of (r, g, b) tuples.
+    """Write a minimal 8-bit RGB PNG from a flat buffer of packed RGB bytes.
+
+    `pixels_rgb` is any bytes-like object of length width * height * 3,
+    laid out row-major with no padding.
 
     Uses Python's built-in struct and zlib — no PIL dependency.
     """
-    def _chunk(chunk_type, data):
-        c = chunk_type + data
-        return struct.pack(">I", len(data)) + c + struct.pack(">I", zlib.crc32(c) & 0xFFFFFFFF)
-
-    # IHDR.
-    ihdr_data = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
-    # IDAT: each row starts with filter byte 0 (None).
-    raw_rows = b""
+    # IDAT: each row starts with filter byte 0 (None). Scanlines are fed to
+    # an incremental compressor, so the uncompressed image is never held in
+    # memory alongside the compressed one. Default level (6): level 9 costs
+    # extra CPU for a negligible size win on these synthetic textures, while
+    # level 1 roughly triples the file size.
+    stride = width * 3
+    rows = memoryview(pixels_rgb)  # zero-copy row slices
+    compressor = zlib.compressobj()
+    idat_parts = []
     for y in range(height):
-        raw_rows += b"\x00"  # filter: None
-        for x in range(width):
-            r, g, b = pixels_rgb[y * width + x]
-            raw_rows += bytes([r, g, b])
-    idat_data = zlib.compress(raw_rows, 9)
+        idat_parts.append(compressor.compress(b"\x00"))
+        idat_parts.append(compressor.compress(rows[y * stride:(y + 1) * stride]))
+    idat_parts.append(compressor.flush())
+    _write_png_file(filepath, width, height, b"".join(idat_parts))
+
 
-    with open(filepath, "wb") as f:
-        f.write(b"\x89PNG\r\n\x1a\n")  # PNG signature
-        f.write(_chunk(b"IHDR", ihdr_data))
-        f.write(_chunk(b"IDAT", idat_data))
-        f.write(_chunk(b"IEND", b""))
+def _write_solid_png(filepath, width, height, rgb):
+    """Write a PNG where every pixel is `rgb` — no per-row pixel work.
+
+    Every filtered scanline is identical, so one is built and the repeated
+    stream is compressed in a single call (same bytes as _write_png).
+    """
+    scanline = b"\x00" + bytes(rgb) * width
+    _write_png_file(filepath, width, height, zlib.compress(scanline * height))
 
 
+@_cached_output
 def generate_brick_normal_map(filepath, width=256, height=256):
     """Generate a tiling brick normal map.
 
@@ -214,20 +302,29 @@ def generate_brick_normal_map(filepath, width=256, height=256):
     mortar = 3              # mortar width in pixels
     bevel = 2               # edge bevel in pixels
 
-    pixels = []
-    for y in range(height):
-        row_idx = y // brick_h
-        offset = (brick_w // 2) if (row_idx % 2 == 1) else 0
-        for x in range(width):
-            bx = (x + offset) % brick_w
-            by = y % brick_h
-
+    # Bevel normals only take nx, ny in {-0.5, 0, 0.5}, so encode the nine
+    # possible tangent-space colors up front instead of per pixel.
+    bevel_colors = {}
+    for nx in (-0.5, 0.0, 0.5):
+        for ny in (-0.5, 0.0, 0.5):
+            nz = math.sqrt(max(0.0, 1.0 - nx * nx - ny * ny))
+            r = int((nx * 0.5 + 0.5) * 255)
+            g = int((ny * 0.5 + 0.5) * 255)
+            b = int(nz * 255)
+            bevel_colors[nx, ny] = bytes((r, g, b))
+
+    # Every brick is identical, so shade a single brick cell once and tile
+    # its rows across the image instead of evaluating every pixel.
+    cell = []
+    for by in range(brick_h):
+        cell_row = bytearray()
+        for bx in range(brick_w):
             # Check if in mortar.
             in_mortar = bx < mortar or by < mortar
 
             if in_mortar:
                 # Mortar is slightly recessed — normal dips toward center.
-                pixels.append((128, 128, 200))
+                cell_row += b"\x80\x80\xc8"  # (128, 128, 200)
             else:
                 # Check distance to edge for bevel.
                 dist_left = bx - mortar
@@ -247,40 +344,47 @@ def generate_brick_normal_map(filepath, width=256, height=256):
                         ny = -0.5
                     elif dist_top == min_dist:
                         ny = 0.5
-                    # Encode tangent-space normal.
-                    nz = math.sqrt(max(0.0, 1.0 - nx * nx - ny * ny))
-                    r = int((nx * 0.5 + 0.5) * 255)
-                    g = int((ny * 0.5 + 0.5) * 255)
-                    b = int(nz * 255)
-                    pixels.append((r, g, b))
+                    cell_row += bevel_colors[nx, ny]
                 else:
                     # Flat brick face — tangent-space up.
-                    pixels.append((128, 128, 255))
+                    cell_row += b"\x80\x80\xff"  # (128, 128, 255)
+        cell.append(cell_row)
+
+    # Repeat each cell row far enough to cover the half-brick running-bond
+    # offset, then slice out one scanline per image row.
+    repeats = -(-(width + brick_w // 2) // brick_w)  # ceil division
+    tiled_rows = [cell_row * repeats for cell_row in cell]
+    pixels = bytearray()
+    for y in range(height):
+        row_idx = y // brick_h
+        offset = (brick_w // 2) if (row_idx % 2 == 1) else 0
+        pixels += tiled_rows[y % brick_h][offset * 3:(offset + width) * 3]
 
     _write_png(filepath, width, height, pixels)
     print(f"  Generated {filepath} ({width}×{height} brick normal map)")
 
 
+@_cached_output
 def generate_checker_albedo(filepath, width=256, height=256, tile_size=32):
     """Generate a checker pattern albedo texture (light/dark gray)."""
-    pixels = []
+    light, dark = bytes((200, 200, 200)), bytes((80, 80, 80))
+    # Only two distinct scanlines exist: one starting light, one starting dark.
+    repeats = -(-width // (2 * tile_size))  # ceil division
+    even_row = ((light * tile_size + dark * tile_size) * repeats)[:width * 3]
+    odd_row = ((dark * tile_size + light * tile_size) * repeats)[:width * 3]
+
+    pixels = bytearray()
     for y in range(height):
-        for x in range(width):
-            cx = (x // tile_size) % 2
-            cy = (y // tile_size) % 2
-            if (cx + cy) % 2 == 0:
-                pixels.append((200, 200, 200))
-            else:
-                pixels.append((80, 80, 80))
+        pixels += even_row if (y // tile_size) % 2 == 0 else odd_row
 
     _write_png(filepath, width, height, pixels)
     print(f"  Generated {filepath} ({width}×{height} checker albedo)")
 
 
+@_cached_output
 def generate_flat_normal(filepath, width=8, height=8):
     """Generate a tiny flat normal map (128, 128, 255) — useful as default."""
-    pixels = [(128, 128, 255)] * (width * height)
-    _write_png(filepath, width, height, pixels)
+    _write_solid_png(filepath, width, height, (128, 128, 255))
     print(f"  Generated {filepath} ({width}×{height} flat normal)")
 
 
@@ -288,6 +392,38 @@ def generate_flat_normal(filepath, width=8, height=8):
 # HDR environment map generator (Radiance RGBE format)
 # ============================================================
 
+def _float_to_rgbe(r, g, b):
+    """Convert linear RGB float to a packed 4-byte RGBE pixel."""
+    v = max(r, g, b)
+    if v < 1e-32:
+        return b"\x00\x00\x00\x00"
+    # frexp returns (mantissa, exponent) where mantissa is in [0.5, 1.0).
+    mantissa, exp = math.frexp(v)
+    scale = mantissa * 256.0 / v
+    return bytes((
+        min(255, int(r * scale)),
+        min(255, int(g * scale)),
+        min(255, int(b * scale)),
+        exp + 128
+    ))
+
+
+def _rle_constant_scanline(rgbe, width):
+    """Encode a constant-color scanline with Radiance adaptive RLE.
+
+    Channels are stored planar after a (2, 2, width_hi, width_lo) marker;
+    each channel of a constant row is just a sequence of (128 + n, value)
+    runs, with n capped at 127 per run.
+    """
+    runs = [min(127, width - x) for x in range(0, width, 127)]
+    out = bytearray((2, 2, width >> 8, width & 0xFF))
+    for value in rgbe:
+        for n in runs:
+            out += bytes((128 + n, value))
+    return bytes(out)
+
+
+@_cached_output
 def generate_gradient_sky_hdr(filepath, width=512, height=256):
     """Generate a simple sky gradient as a Radiance .hdr file.
 
@@ -297,57 +433,47 @@ def generate_gradient_sky_hdr(filepath, width=512, height=256):
 
     Uses Radiance RGBE encoding (Ward, 1991).
     """
-    def _float_to_rgbe(r, g, b):
-        """Convert linear RGB float to RGBE (8-bit per channel)."""
-        v = max(r, g, b)
-        if v < 1e-32:
-            return (0, 0, 0, 0)
-        # frexp returns (mantissa, exponent) where mantissa is in [0.5, 1.0).
-        mantissa, exp = math.frexp(v)
-        scale = mantissa * 256.0 / v
-        return (
-            min(255, int(r * scale)),
-            min(255, int(g * scale)),
-            min(255, int(b * scale)),
-            exp + 128
-        )
-
     # Zenith/horizon/ground colors (linear).
     zenith = (0.25, 0.35, 0.85)
     horizon = (0.85, 0.80, 0.75)
     ground = (0.15, 0.12, 0.10)
 
-    with open(filepath, "wb") as f:
-        # Header.
-        f.write(b"#?RADIANCE\n")
-        f.write(b"FORMAT=32-bit_rle_rgbe\n")
-        f.write(b"\n")
-        f.write(f"-Y {height} +X {width}\n".encode("ascii"))
-
-        # Pixel data (uncompressed scanlines).
-        for y in range(height):
-            # v maps from 0 (top = zenith) to 1 (bottom = nadir).
-            v = y / (height - 1)
-            # Elevation angle: 0 = zenith, 0.5 = horizon, 1 = nadir.
-            if v <= 0.5:
-                # Sky: zenith to horizon.
-                t = v / 0.5  # 0..1
-                # Smooth interpolation.
-                t = t * t * (3.0 - 2.0 * t)
-                r = zenith[0] + (horizon[0] - zenith[0]) * t
-                g = zenith[1] + (horizon[1] - zenith[1]) * t
-                b = zenith[2] + (horizon[2] - zenith[2]) * t
-            else:
-                # Ground: horizon to ground.
-                t = (v - 0.5) / 0.5
-                t = t * t * (3.0 - 2.0 * t)
-                r = horizon[0] + (ground[0] - horizon[0]) * t
-                g = horizon[1] + (ground[1] - horizon[1]) * t
-                b = horizon[2] + (ground[2] - horizon[2]) * t
-
-            for x in range(width):
-                rgbe = _float_to_rgbe(r, g, b)
-                f.write(bytes(rgbe))
+    # Each half of the panorama is one smoothstep blend: sky runs zenith ->
+    # horizon, ground runs horizon -> ground. Precompute each segment's start
+    # color and per-channel delta so every row is a single lerp.
+    sky = (zenith, tuple(h - z for z, h in zip(zenith, horizon)))
+    land = (horizon, tuple(g - h for h, g in zip(horizon, ground)))
+
+    # Each scanline is a single constant color, so encode one RGBE pixel per
+    # row and either run-length encode it or repeat it across the width.
+    # Adaptive RLE is only defined for widths in [8, 32767].
+    use_rle = 8 <= width <= 0x7FFF
+    scanlines = []
+    for y in range(height):
+        # v maps from 0 (top = zenith) to 1 (bottom = nadir).
+        v = y / (height - 1)
+        # Elevation angle: 0 = zenith, 0.5 = horizon, 1 = nadir.
+        if v <= 0.5:
+            t, (start, delta) = v / 0.5, sky
+        else:
+            t, (start, delta) = (v - 0.5) / 0.5, land
+        # Smooth interpolation.
+        t = t * t * (3.0 - 2.0 * t)
+        r, g, b = (c + d * t for c, d in zip(start, delta))
+
+        rgbe = _float_to_rgbe(r, g, b)
+        if use_rle:
+            scanlines.append(_rle_constant_scanline(rgbe, width))
+        else:
+            scanlines.append(rgbe * width)
+
+    header = (
+        b"#?RADIANCE\n"
+        b"FORMAT=32-bit_rle_rgbe\n"
+        b"\n"
+        + f"-Y {height} +X {width}\n".encode("ascii")
+    )
+    Path(filepath).write_bytes(header + b"".join(scanlines))
 
     print(f"  Generated {filepath} ({width}×{height} gradient sky HDR)")
 
@@ -357,28 +483,43 @@ def generate_gradient_sky_hdr(filepath, width=512, height=256):
 # ============================================================
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Generate procedural demo assets into project/assets/.")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Regenerate every asset even if its .stamp is current")
+    args = parser.parse_args()
+
+    # Every generator writes its own file and shares no state, so this table
+    # is safe to fan out to a process pool. It deliberately runs serially:
+    # the whole table takes ~20 ms, while starting a ProcessPoolExecutor
+    # alone costs ~60 ms.
+    sections = [
+        ("Meshes", MESHES_DIR, [
+            (generate_uv_sphere, "uv_sphere.obj"),
+            (generate_subdivided_plane, "subdivided_plane.obj"),
+            (generate_room_box, "room_box.obj"),
+        ]),
+        ("Textures", TEXTURES_DIR, [
+            (generate_brick_normal_map, "brick_normal.png"),
+            (generate_checker_albedo, "checker_albedo.png"),
+            (generate_flat_normal, "flat_normal.png"),
+        ]),
+        ("Environments", ENVS_DIR, [
+            (generate_gradient_sky_hdr, "gradient_sky.hdr"),
+        ]),
+    ]
+
+    # Create output directories up front, before any generator runs.
     ensure_dirs()
     print("Generating demo assets...")
     print()
 
-    # Meshes.
-    print("[Meshes]")
-    generate_uv_sphere(os.path.join(MESHES_DIR, "uv_sphere.obj"))
-    generate_subdivided_plane(os.path.join(MESHES_DIR, "subdivided_plane.obj"))
-    generate_room_box(os.path.join(MESHES_DIR, "room_box.obj"))
-    print()
-
-    # Textures.
-    print("[Textures]")
-    generate_brick_normal_map(os.path.join(TEXTURES_DIR, "brick_normal.png"))
-    generate_checker_albedo(os.path.join(TEXTURES_DIR, "checker_albedo.png"))
-    generate_flat_normal(os.path.join(TEXTURES_DIR, "flat_normal.png"))
-    print()
-
-    # Environments.
-    print("[Environments]")
-    generate_gradient_sky_hdr(os.path.join(ENVS_DIR, "gradient_sky.hdr"))
-    print()
+    for title, directory, tasks in sections:
+        print(f"[{title}]")
+        for generate, filename in tasks:
+            generate(directory / filename, force=args.force)
+        print()
 
     print("Done! All assets written to project/assets/")
 
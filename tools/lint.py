@@ -26,6 +26,9 @@ USAGE
   python tools/lint.py --rule godot-native # only godot-native rules
   python tools/lint.py --summary           # rule-by-rule counts
   python tools/lint.py --verbose           # show passing files too
+  python tools/lint.py --jobs 1            # lint serially (default: all CPUs)
+  python tools/lint.py --no-cache          # ignore and skip tools/.lintcache
+  NO_COLOR=1 python tools/lint.py          # plain output even on a terminal
 
 SUPPRESSION
   Inline:   // rt-lint: suppress godot-native/parallel-state-cpp
@@ -41,12 +44,20 @@ EXIT CODES
 from __future__ import annotations
 
 import argparse
+import bisect
+import functools
+import hashlib
+import json
+import os
 import re
 import sys
 import textwrap
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import AbstractSet, Optional
 
 # ──────────────────────────────────────────────────────────────────────
 #  Configuration
@@ -57,8 +68,8 @@ SRC_DIR = "src"
 DEMO_DIR = "project/demos"
 
 # Files / directories to skip entirely.
-SKIP_DIRS = {"gen", "thirdparty", "godot-cpp", "__pycache__", ".git", "bin"}
-SKIP_FILES = {"doc_data.gen.cpp"}
+SKIP_DIRS = frozenset({"gen", "thirdparty", "godot-cpp", "__pycache__", ".git", "bin"})
+SKIP_FILES = frozenset({"doc_data.gen.cpp"})
 
 # File suffixes that indicate auto-generated code (skip entirely).
 SKIP_SUFFIXES = (".gen.h", ".gen.cpp")
@@ -66,11 +77,23 @@ SKIP_SUFFIXES = (".gen.h", ".gen.cpp")
 # Minimum non-trivial function body length that requires 2+ assertions.
 MIN_FUNCTION_BODY_LINES = 5
 
+# A worker process costs more to start than linting a few files (each takes
+# a few milliseconds), so spawn at most one per this many files.  With fewer
+# than two workers' worth of files the run stays serial.
+MIN_FILES_PER_WORKER = 16
+
+# Per-file results cache (relative to project root).  Entries are keyed by a
+# hash of the file contents, its lint.conf rules, the rule filter and this
+# script, so any edit to the linter invalidates every entry.  Results are
+# stored per --rule filter, so filtered and full runs never evict each other.
+CACHE_FILE = "tools/.lintcache"
+_LINT_DIGEST = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
+
 # ──────────────────────────────────────────────────────────────────────
 #  Data types
 # ──────────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class Violation:
     """A single lint violation."""
     file: str
@@ -83,7 +106,7 @@ class Violation:
         return f"{self.file}:{self.line}: {self.severity.capitalize()}: {self.message} ({self.rule})"
 
 
-@dataclass
+@dataclass(slots=True)
 class LintStats:
     """Aggregate statistics for a lint run."""
     files_checked: int = 0
@@ -96,10 +119,7 @@ class LintStats:
         return self.files_checked - self.files_passed
 
     def rule_counts(self) -> dict[str, int]:
-        counts: dict[str, int] = {}
-        for v in self.violations:
-            counts[v.rule] = counts.get(v.rule, 0) + 1
-        return dict(sorted(counts.items()))
+        return dict(sorted(Counter(map(attrgetter("rule"), self.violations)).items()))
 
 
 # ──────────────────────────────────────────────────────────────────────
@@ -146,33 +166,46 @@ def _load_file_suppressions(root: Path) -> dict[str, set[str]]:
 #  RULE IMPLEMENTATIONS
 # ══════════════════════════════════════════════════════════════════════
 
+def applies_to(*suffixes: str, head: Optional[int] = None):
+    """Declare the file suffixes a check runs on.
+
+    lint_file skips a check for any other file before calling it, so check
+    bodies never test the path themselves.  A check that only reads the
+    first few lines declares how many as head; when every check selected
+    for a file does, lint_file splits just those lines.
+    """
+    def mark(check_fn):
+        check_fn.suffixes = suffixes
+        check_fn.head = head
+        return check_fn
+    return mark
+
+
 # ──────────────────────────────────────────────────────────────
 #  header/  — File header conventions
 # ──────────────────────────────────────────────────────────────
 
-def check_header_pragma_once(path: str, lines: list[str]) -> list[Violation]:
+@applies_to(".h", head=1)
+def check_header_pragma_once(path: str, lines: list[str], text: str) -> list[Violation]:
     """header/pragma-once — Headers must start with #pragma once."""
-    if not path.endswith(".h"):
-        return []
     if not lines or lines[0].strip() != "#pragma once":
         return [Violation(path, 1, "header/pragma-once",
                           "Header must start with '#pragma once'")]
     return []
 
 
-def check_header_description(path: str, lines: list[str]) -> list[Violation]:
+@applies_to(".h", head=2)
+def check_header_description(path: str, lines: list[str], text: str) -> list[Violation]:
     """header/description — Line 2 must be '// filename — description'."""
-    if not path.endswith(".h"):
-        return []
     if len(lines) < 2:
         return [Violation(path, 2, "header/description",
                           "Missing file description on line 2")]
-    filename = Path(path).name
+    filename = path.rpartition("/")[2]
     line2 = lines[1].strip()
     # Accept: // filename.h — description  OR  // filename — description
     # also accept em-dash (—) or double-dash (--)
     stem = filename.replace(".h", "")
-    if not (line2.startswith(f"// {filename}") or line2.startswith(f"// {stem}")):
+    if not line2.startswith((f"// {filename}", f"// {stem}")):
         return [Violation(path, 2, "header/description",
                           f"Line 2 should be '// {filename} — description'")]
     return []
@@ -185,13 +218,18 @@ def check_header_description(path: str, lines: list[str]) -> list[Violation]:
 # Matches ALL assertion macros: RT_ASSERT, RT_VERIFY, RT_SLOW_ASSERT, RT_UNREACHABLE,
 # and convenience macros: RT_ASSERT_VALID_RAY, RT_ASSERT_FINITE, RT_ASSERT_NOT_NULL,
 # RT_ASSERT_BOUNDS, RT_ASSERT_BOUNDS_U, RT_ASSERT_POSITIVE, RT_ASSERT_NORMALIZED,
-# RT_ASSERT_INDEX.  Uses \b only at the start to avoid missing suffixed variants.
-_ASSERT_RE = re.compile(r"\bRT_(ASSERT|VERIFY|SLOW_ASSERT|UNREACHABLE)\w*")
-
-# Matches function definitions (not declarations): return_type name(...) {
+# RT_ASSERT_INDEX.  Bounded only at the start so suffixed variants still match;
+# only search() is used, so there is no group and no trailing \w* to consume
+# (dropping it is what made the per-line search cheaper).  The leading \b
+# hides the RT_ literal from the engine's prefix scan; _assertion_lines
+# makes up for that with a substring test.
+_ASSERT_RE = re.compile(r"\bRT_(?:ASSERT|VERIFY|SLOW_ASSERT|UNREACHABLE)")
+
+# Matches function definitions: return_type name(...) {
+# Lookahead-free: check_tiger_assertion_density first rejects, with plain
+# string tests, lines lacking '(' or '{', preprocessor lines (any '#') and
+# declarations (trailing ';'), so the regex only sees real candidates.
 _FUNC_DEF_RE = re.compile(
-    r"^(?!.*;\s*$)"                   # not a declaration (no trailing ;)
-    r"(?!.*#)"                        # not a preprocessor line
     r"\s*"
     r"(?:(?:static|inline|virtual|constexpr|const|explicit)\s+)*"
     r"(?:[\w:*&<>,\s]+\s+)"          # return type (rough)
@@ -210,14 +248,71 @@ _CPP_KEYWORDS = frozenset({
     "reinterpret_cast", "co_await", "co_return", "co_yield",
 })
 
-def check_tiger_assertion_density(path: str, lines: list[str]) -> list[Violation]:
+# Trivial functions exempt from assertion density: getters, setters,
+# constructors, bind_methods, operators, notification dispatchers, and empty
+# virtual hooks.
+_TRIVIAL_FUNC_PREFIXES = ("get_", "set_", "is_", "has_", "_bind_methods",
+                          "operator", "_notification")
+
+# Tokens that can contain braces which are not code: comments and string or
+# char literals.  A char literal holds one character or one escape sequence
+# and never follows an identifier or digit character, so C++14 digit
+# separators (1'000) are not mistaken for one; u8/u/U/L prefixes are kept.
+_NON_CODE_RE = re.compile(
+    r'//[^\n]*'                   # line comment
+    r'|/\*.*?\*/'                 # block comment (may span lines)
+    r'|"(?:[^"\\\n]|\\.)*"'       # string literal
+    r"|(?<![0-9A-Za-z_])(?:u8|[uUL])?'"    # char literal: one character
+    r"(?:[^'\\\n]|\\(?:x[0-9A-Fa-f]+|u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}"
+    r"|[0-7]{1,3}|[^\n]))'",                 # ... or one escape sequence
+    re.DOTALL,
+)
+# Everything that is neither a brace nor a line break.
+_NOT_BRACE_RE = re.compile(r"[^{}\n]+")
+
+
+def _keep_newlines(m: re.Match) -> str:
+    return "\n" * m.group().count("\n")
+
+
+def _code_braces(text: str) -> list[str]:
+    """Return, per line, the code braces in order (e.g. "}{"), ignoring any
+    inside comments and string/char literals.
+
+    Two whole-file substitutions: blank out non-code tokens (keeping their
+    line breaks), then drop every non-brace character.  Braces themselves
+    never surface as Python-level match objects.
+    """
+    text = _NON_CODE_RE.sub(_keep_newlines, text)
+    return _NOT_BRACE_RE.sub("", text).split("\n")
+
+
+def _assertion_lines(lines: list[str]) -> list[int]:
+    """Return the ascending 0-based indices of lines containing an assertion.
+
+    Every macro starts with RT_, so a C-level substring test rejects almost
+    every line and the regex only confirms the few that remain.  (A single
+    finditer over the whole text measured ~12× slower: _ASSERT_RE's leading
+    word boundary leaves the engine no literal prefix to scan for, so the
+    pattern is tried at every position.)
+    """
+    return [k for k, line in enumerate(lines) if "RT_" in line and _ASSERT_RE.search(line)]
+
+
+@applies_to(".h", ".cpp")
+def check_tiger_assertion_density(path: str, lines: list[str], text: str) -> list[Violation]:
     """tiger/assertion-density — Non-trivial functions need ≥2 assertions."""
-    if not (path.endswith(".h") or path.endswith(".cpp")):
-        return []
     violations = []
+    braces: Optional[list[str]] = None  # built on the first definition seen
+    assert_lines: list[int] = []
     i = 0
     while i < len(lines):
-        m = _FUNC_DEF_RE.match(lines[i])
+        line = lines[i]
+        if ("{" not in line or "(" not in line or "#" in line
+                or line.rstrip().endswith(";")):
+            i += 1
+            continue
+        m = _FUNC_DEF_RE.match(line)
         if not m:
             i += 1
             continue
@@ -229,24 +324,22 @@ def check_tiger_assertion_density(path: str, lines: list[str]) -> list[Violation
         if unqualified in _CPP_KEYWORDS:
             i += 1
             continue
-        # Skip trivial functions: getters, setters, constructors, bind_methods,
-        # operators, notification dispatchers, and empty virtual hooks.
-        _TRIVIAL_PREFIXES = ("get_", "set_", "is_", "has_", "_bind_methods",
-                             "operator", "_notification")
-        if any(unqualified.startswith(p) for p in _TRIVIAL_PREFIXES):
+        # Skip trivial functions (see _TRIVIAL_FUNC_PREFIXES).
+        if unqualified.startswith(_TRIVIAL_FUNC_PREFIXES):
             i += 1
             continue
 
-        # Find the matching closing brace.
+        # Find the matching closing brace, counting only code braces.
         # Start brace_depth = 1 (for the opening '{' on the definition line).
         # Must also count any additional braces on the definition line itself
         # (handles one-liner functions: "int foo() { return x; }").
-        brace_depth = 0
-        for ch in lines[i]:
-            if ch == '{':
-                brace_depth += 1
-            elif ch == '}':
-                brace_depth -= 1
+        if braces is None:
+            braces = _code_braces(text)
+            # Every assertion macro starts with RT_; without one in the file,
+            # every body has zero assertions and the scan can be skipped.
+            if "RT_" in text:
+                assert_lines = _assertion_lines(lines)
+        brace_depth = braces[i].count('{') - braces[i].count('}')
 
         # If the function opens and closes on the same line, skip it.
         if brace_depth <= 0:
@@ -256,13 +349,23 @@ def check_tiger_assertion_density(path: str, lines: list[str]) -> list[Violation
         body_start = i + 1
         j = body_start
         while j < len(lines) and brace_depth > 0:
-            for ch in lines[j]:
-                if ch == '{':
-                    brace_depth += 1
-                elif ch == '}':
-                    brace_depth -= 1
-                    if brace_depth == 0:
-                        break
+            line_braces = braces[j]
+            closes = line_braces.count('}')
+            if closes < brace_depth:
+                # Depth cannot reach 0 on this line; let str.count do the work.
+                brace_depth += len(line_braces) - 2 * closes
+            elif '{' not in line_braces:
+                # Only closers (the usual lone "}"): the function ends here.
+                brace_depth = 0
+            else:
+                # This line may close the function: scan for the exact brace.
+                for ch in line_braces:
+                    if ch == '{':
+                        brace_depth += 1
+                    elif ch == '}':
+                        brace_depth -= 1
+                        if brace_depth == 0:
+                            break
             j += 1
         body_end = j
 
@@ -271,11 +374,9 @@ def check_tiger_assertion_density(path: str, lines: list[str]) -> list[Violation
             i = body_end
             continue
 
-        # Count assertions in the body.
-        assert_count = sum(
-            1 for k in range(body_start, min(body_end, len(lines)))
-            if _ASSERT_RE.search(lines[k])
-        )
+        # Count assertion lines in the body: two bisects, no re-scan.
+        assert_count = (bisect.bisect_left(assert_lines, body_end)
+                        - bisect.bisect_left(assert_lines, body_start))
         if assert_count < 2:
             violations.append(Violation(
                 path, i + 1, "tiger/assertion-density",
@@ -294,18 +395,31 @@ def check_tiger_assertion_density(path: str, lines: list[str]) -> list[Violation
 
 # Matches GPU struct definitions (not forward declarations ending with ;).
 _GPU_STRUCT_DEF_RE = re.compile(r"\bstruct\s+(GPU\w+Packed)\b[^;]*\{")
+# Names asserted as static_assert(sizeof(Name)...  — literal spelling, no
+# whitespace tolerance, matching the convention the rule enforces.
+_STATIC_ASSERT_SIZEOF_RE = re.compile(r"static_assert\(sizeof\((\w+)\)")
 
-def check_gpu_static_assert(path: str, lines: list[str]) -> list[Violation]:
+@applies_to(".h", ".cpp")
+def check_gpu_static_assert(path: str, lines: list[str], text: str) -> list[Violation]:
     """gpu/static-assert — GPU structs need static_assert(sizeof(...))."""
-    if not (path.endswith(".h") or path.endswith(".cpp")):
+    # Every rule-relevant struct name starts with GPU and ends with Packed;
+    # two substring tests skip the regex for most files.
+    if "Packed" not in text or "GPU" not in text:
         return []
     violations = []
-    full_text = "\n".join(lines)
-    for m in _GPU_STRUCT_DEF_RE.finditer(full_text):
+    # Matches arrive in order, so count newlines incrementally from the
+    # previous match instead of re-slicing the whole prefix each time.
+    line_no, scanned = 1, 0
+    asserted: Optional[set[str]] = None
+    for m in _GPU_STRUCT_DEF_RE.finditer(text):
         struct_name = m.group(1)
-        if f"static_assert(sizeof({struct_name})" not in full_text:
+        # One scan per file for all asserted names, only once a struct is seen.
+        if asserted is None:
+            asserted = set(_STATIC_ASSERT_SIZEOF_RE.findall(text))
+        if struct_name not in asserted:
             # Find the line number of the struct definition.
-            line_no = full_text[:m.start()].count('\n') + 1
+            line_no += text.count('\n', scanned, m.start())
+            scanned = m.start()
             violations.append(Violation(
                 path, line_no, "gpu/static-assert",
                 f"GPU struct '{struct_name}' needs static_assert(sizeof(...))"
@@ -318,31 +432,36 @@ def check_gpu_static_assert(path: str, lines: list[str]) -> list[Violation]:
 # ──────────────────────────────────────────────────────────────
 
 # Files in modules/ must not include from godot/ or other internal modules.
+# One alternation per prefix, so each line costs a single search however
+# many headers are forbidden.
 _FORBIDDEN_INCLUDES = {
-    "modules/": [
-        re.compile(r'#include\s*"godot/'),
-        re.compile(r'#include\s*"raytracer_server\.h"'),
-        re.compile(r'#include\s*"dispatch/thread_pool\.h"'),
-        re.compile(r'#include\s*"accel/'),
-        re.compile(r'#include\s*"gpu/gpu_structs\.h"'),
-    ]
+    "modules/": re.compile(
+        r'#include\s*"(?:'
+        r'godot/'
+        r'|raytracer_server\.h"'
+        r'|dispatch/thread_pool\.h"'
+        r'|accel/'
+        r'|gpu/gpu_structs\.h"'
+        r')'
+    ),
 }
 
-def check_module_boundary(path: str, lines: list[str]) -> list[Violation]:
+@applies_to(".h", ".cpp")
+def check_module_boundary(path: str, lines: list[str], text: str) -> list[Violation]:
     """module/boundary — Modules must not include server internals."""
-    if not (path.endswith(".h") or path.endswith(".cpp")):
-        return []
     violations = []
-    for module_prefix, patterns in _FORBIDDEN_INCLUDES.items():
-        if module_prefix not in path.replace("\\", "/"):
+    for module_prefix, pattern in _FORBIDDEN_INCLUDES.items():
+        if module_prefix not in path:
             continue
         for i, line in enumerate(lines):
-            for pat in patterns:
-                if pat.search(line):
-                    violations.append(Violation(
-                        path, i + 1, "module/boundary",
-                        f"Module file must not include internal header: {line.strip()}"
-                    ))
+            # Cheap substring reject: almost no lines are includes.
+            if "#include" not in line:
+                continue
+            if pattern.search(line):
+                violations.append(Violation(
+                    path, i + 1, "module/boundary",
+                    f"Module file must not include internal header: {line.strip()}"
+                ))
     return violations
 
 
@@ -353,12 +472,11 @@ def check_module_boundary(path: str, lines: list[str]) -> list[Violation]:
 _CLASS_DECL_RE = re.compile(r"^\s*(?:class|struct)\s+(\w+)\s*[:{]")
 _PASCAL_RE = re.compile(r"^[A-Z][a-zA-Z0-9]*$")
 # Allow GPU-prefixed names and data-transfer structs
-_NAMING_EXEMPT = {"GDCLASS", "VARIANT_ENUM_CAST"}
+_NAMING_EXEMPT = frozenset({"GDCLASS", "VARIANT_ENUM_CAST"})
 
-def check_naming_class_pascal(path: str, lines: list[str]) -> list[Violation]:
+@applies_to(".h")
+def check_naming_class_pascal(path: str, lines: list[str], text: str) -> list[Violation]:
     """naming/class-pascal — Class/struct names must be PascalCase."""
-    if not path.endswith(".h"):
-        return []
     violations = []
     for i, line in enumerate(lines):
         m = _CLASS_DECL_RE.match(line)
@@ -454,10 +572,49 @@ _GODOT_OWNED_MEMBERS: list[tuple[re.Pattern, str, str]] = [
     (re.compile(r"\bcamera_far_\b"),          "Camera3D", "get_far()"),
 ]
 
+
+def _trie_pattern(words) -> str:
+    """Regex source matching exactly one of words, shared prefixes factored.
+
+    ["sun_color_", "sun_energy_"] becomes "sun_(?:color_|energy_)", so the
+    engine rejects a non-candidate position after a character or two rather
+    than trying every alternative in turn (cf. Pygments' regex_opt).
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end of a word
+
+    def emit(node: dict) -> str:
+        is_end = "" in node
+        alts = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        if len(alts) == 1 and not is_end:
+            return alts[0]
+        group = "(?:" + "|".join(alts) + ")"
+        return group + "?" if is_end else group
+
+    return emit(trie)
+
+
+# The whole table fused into one prefix-factored alternation, so a line
+# costs a single scan instead of one search per entry.  The matched text is
+# the member name itself; _GODOT_OWNED_INFO maps it back to (table position,
+# node type, read method).  No named groups, which would defeat the
+# engine's literal fast paths.
+_GODOT_OWNED_INFO: dict[str, tuple[int, str, str]] = {
+    pat.pattern.replace(r"\b", ""): (index, node_type, read_method)
+    for index, (pat, node_type, read_method) in enumerate(_GODOT_OWNED_MEMBERS)
+}
+_GODOT_OWNED_RE = re.compile(r"\b(?:" + _trie_pattern(_GODOT_OWNED_INFO) + r")\b")
+
 # Structs whose job is to *transfer* scene data to pure functions.
 # They're allowed to have these member names because they don't *own* state —
 # they're populated per-frame from actual Godot nodes.
-_DATA_TRANSFER_STRUCTS = {
+_DATA_TRANSFER_STRUCTS = frozenset({
     "EnvironmentData",   # shade_pass.h — populated per frame from Environment
     "LightData",         # light_data.h — populated per frame from Light nodes
     "SceneShadeData",    # scene_shade_data.h — read-only batch of scene data
@@ -467,7 +624,13 @@ _DATA_TRANSFER_STRUCTS = {
     "GPUHitResultPacked",
     "GPUMaterialPacked",
     "GPULightPacked",
-}
+})
+
+# Opens a struct/class scope (looser than _CLASS_DECL_RE: no trailing : or {).
+_SCOPE_DECL_RE = re.compile(r"\s*(?:struct|class)\s+(\w+)")
+
+# A line whose first non-blank characters open or continue a comment.
+_COMMENT_LINE_RE = re.compile(r"^[^\S\n]*(?://|/\*|\*)", re.MULTILINE)
 
 # Hardcoded scene values: constexpr/static const for things that belong on nodes.
 _HARDCODED_SCENE_PATTERNS: list[tuple[re.Pattern, str]] = [
@@ -479,29 +642,42 @@ _HARDCODED_SCENE_PATTERNS: list[tuple[re.Pattern, str]] = [
      "Depth range should be read from Camera3D (get_far() - get_near())"),
 ]
 
+# All of the above as one search.  Used only as a gate: the patterns use
+# .* and one line can trip several, so a hit falls through to the per-pattern
+# loop to report each message.  Nearly every line fails the gate.
+_HARDCODED_SCENE_ANY_RE = re.compile(
+    "|".join(f"(?:{pat.pattern})" for pat, _ in _HARDCODED_SCENE_PATTERNS),
+    re.IGNORECASE,
+)
 
-def check_godot_native_cpp(path: str, lines: list[str]) -> list[Violation]:
+
+@applies_to(".h", ".cpp")
+def check_godot_native_cpp(path: str, lines: list[str], text: str) -> list[Violation]:
     """godot-native/parallel-state-cpp — C++ members duplicating Godot node state.
 
     Detects member variables in C++ classes that shadow properties available
     on standard Godot scene nodes.  Exempts data-transfer structs whose
     purpose is to carry batched scene reads to pure functions.
     """
-    if not (path.endswith(".h") or path.endswith(".cpp")):
-        return []
-
     violations = []
-    full_text = "\n".join(lines)
+
+    # Indices of comment lines, found in one pass over the text instead of
+    # stripping every line.  Matches come in order, so newlines are counted
+    # incrementally.
+    comment_lines: set[int] = set()
+    line_no = pos = 0
+    for m in _COMMENT_LINE_RE.finditer(text):
+        line_no += text.count("\n", pos, m.start())
+        pos = m.start()
+        comment_lines.add(line_no)
 
     # Check if we're inside a data-transfer struct (exempt).
     current_struct: Optional[str] = None
     struct_depth = 0
 
     for i, line in enumerate(lines):
-        stripped = line.strip()
-
         # Track struct/class scope.
-        struct_match = re.match(r"\s*(?:struct|class)\s+(\w+)", line)
+        struct_match = _SCOPE_DECL_RE.match(line)
         if struct_match:
             current_struct = struct_match.group(1)
             struct_depth = 0
@@ -517,28 +693,35 @@ def check_godot_native_cpp(path: str, lines: list[str]) -> list[Violation]:
             continue
 
         # Skip comments.
-        if stripped.startswith("//") or stripped.startswith("/*") or stripped.startswith("*"):
+        if i in comment_lines:
             continue
 
-        # Check hardcoded scene constants.
-        for pat, msg in _HARDCODED_SCENE_PATTERNS:
-            if pat.search(line):
-                violations.append(Violation(
-                    path, i + 1, "godot-native/hardcoded-scene-val", msg
-                ))
+        # Check hardcoded scene constants.  Every pattern needs one of these
+        # keywords (any case), and a lowered substring test rejects nearly
+        # every line far cheaper than the combined regex.
+        lowered = line.lower()
+        if (("constexpr" in lowered or "static" in lowered)
+                and _HARDCODED_SCENE_ANY_RE.search(line)):
+            for pat, msg in _HARDCODED_SCENE_PATTERNS:
+                if pat.search(line):
+                    violations.append(Violation(
+                        path, i + 1, "godot-native/hardcoded-scene-val", msg
+                    ))
 
         # Check parallel-state members.
         # Only flag lines that look like member declarations (have a type + trailing_;)
         if "_" in line and (";" in line or "=" in line):
-            for pat, node_type, read_method in _GODOT_OWNED_MEMBERS:
-                if pat.search(line):
-                    var_name = pat.pattern.replace(r"\b", "")
-                    violations.append(Violation(
-                        path, i + 1, "godot-native/parallel-state-cpp",
-                        f"Member '{var_name}' duplicates {node_type} state. "
-                        f"Read from {node_type}.{read_method} instead.",
-                        severity="warning"
-                    ))
+            # Each member is a whole word, so matches never overlap; report
+            # each distinct member once, in table order.
+            hits = set(_GODOT_OWNED_RE.findall(line))
+            for var_name in sorted(hits, key=lambda n: _GODOT_OWNED_INFO[n][0]):
+                _, node_type, read_method = _GODOT_OWNED_INFO[var_name]
+                violations.append(Violation(
+                    path, i + 1, "godot-native/parallel-state-cpp",
+                    f"Member '{var_name}' duplicates {node_type} state. "
+                    f"Read from {node_type}.{read_method} instead.",
+                    severity="warning"
+                ))
 
     return violations
 
@@ -553,15 +736,19 @@ _TRY_RE = re.compile(r"\btry\s*\{")
 _CATCH_RE = re.compile(r"\bcatch\s*\(")
 
 # Exception-related standard library headers.
-_EXCEPTION_HEADERS = {
+# Only ever iterated, so a tuple: fixed order, no hashing.
+_EXCEPTION_HEADERS = (
     "<exception>", "<stdexcept>", "<system_error>",
-}
+)
 
 
-def check_no_exceptions_throw(path: str, lines: list[str]) -> list[Violation]:
-    """no-exceptions/throw — No throw, try, or catch keywords."""
-    if not (path.endswith(".h") or path.endswith(".cpp")):
-        return []
+@applies_to(".h", ".cpp")
+def check_no_exceptions(path: str, lines: list[str], text: str) -> list[Violation]:
+    """no-exceptions/throw   — No throw, try, or catch keywords.
+    no-exceptions/include — No #include <exception>/<stdexcept>.
+
+    Both rules share a single pass over the lines.
+    """
     violations = []
     for i, line in enumerate(lines):
         stripped = line.strip()
@@ -583,16 +770,6 @@ def check_no_exceptions_throw(path: str, lines: list[str]) -> list[Violation]:
                 path, i + 1, "no-exceptions/throw",
                 "'catch' block is forbidden — use assertions + return values (Rule 7)"
             ))
-    return violations
-
-
-def check_no_exceptions_include(path: str, lines: list[str]) -> list[Violation]:
-    """no-exceptions/include — No #include <exception>/<stdexcept>."""
-    if not (path.endswith(".h") or path.endswith(".cpp")):
-        return []
-    violations = []
-    for i, line in enumerate(lines):
-        stripped = line.strip()
         if not stripped.startswith("#include"):
             continue
         for header in _EXCEPTION_HEADERS:
@@ -609,7 +786,7 @@ def check_no_exceptions_include(path: str, lines: list[str]) -> list[Violation]:
 # ──────────────────────────────────────────────────────────────
 
 # Types that contain TinyBVH members and must never be stored by value in vectors.
-_TINYBVH_OWNING_TYPES = {"MeshBLAS", "RayScene", "SceneTLAS"}
+_TINYBVH_OWNING_TYPES = frozenset({"MeshBLAS", "RayScene", "SceneTLAS"})
 
 # Pattern: std::vector<TypeName> (without unique_ptr wrapper).
 # Matches std::vector<MeshBLAS>, vector<RayScene>, etc.
@@ -620,10 +797,9 @@ _VECTOR_VALUE_RE = re.compile(
 )
 
 
-def check_tinybvh_no_vector_value(path: str, lines: list[str]) -> list[Violation]:
+@applies_to(".h", ".cpp")
+def check_tinybvh_no_vector_value(path: str, lines: list[str], text: str) -> list[Violation]:
     """tinybvh/no-vector-value — TinyBVH-containing types must use unique_ptr in vectors."""
-    if not (path.endswith(".h") or path.endswith(".cpp")):
-        return []
     violations = []
     for i, line in enumerate(lines):
         stripped = line.strip()
@@ -644,7 +820,9 @@ def check_tinybvh_no_vector_value(path: str, lines: list[str]) -> list[Violation
 #  RULE REGISTRY
 # ══════════════════════════════════════════════════════════════════════
 
-# All check functions, grouped by family.  Each returns list[Violation].
+# All check functions, grouped by family.  Each is called as
+# check(path, lines, text), returns list[Violation], and declares the
+# suffixes it runs on with @applies_to.
 RULE_CHECKS: dict[str, list] = {
     "header": [
         check_header_pragma_once,
@@ -666,8 +844,7 @@ RULE_CHECKS: dict[str, list] = {
         check_godot_native_cpp,
     ],
     "no-exceptions": [
-        check_no_exceptions_throw,
-        check_no_exceptions_include,
+        check_no_exceptions,
     ],
     "tinybvh": [
         check_tinybvh_no_vector_value,
@@ -679,6 +856,37 @@ RULE_CHECKS: dict[str, list] = {
 #  FILE DISCOVERY
 # ══════════════════════════════════════════════════════════════════════
 
+# Suffixes of the files the linter reads.
+_SOURCE_SUFFIXES = (".h", ".cpp", ".gd")
+
+
+def _walk_source_dir(directory: str, files: list[Path]) -> None:
+    """Depth-first os.scandir walk that never descends into SKIP_DIRS.
+
+    Entries are visited in name order at every level, which yields the
+    same ordering as sorted(Path.rglob("*")).  A directory that cannot be
+    listed (missing, not a directory, unreadable) is skipped on its own,
+    as rglob() did; the rest of the walk continues.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            if name not in SKIP_DIRS:
+                _walk_source_dir(entry.path, files)
+            continue
+        # Name tests first: they reject most entries without touching the
+        # DirEntry's stat data.  Auto-generated files are skipped.
+        if (not name.endswith(_SOURCE_SUFFIXES) or name.endswith(SKIP_SUFFIXES)
+                or name in SKIP_FILES or not entry.is_file()):
+            continue
+        files.append(Path(entry.path))
+
+
 def find_source_files(root: Path, explicit_paths: list[str] | None = None) -> list[Path]:
     """Find all lintable source files.
 
@@ -689,26 +897,13 @@ def find_source_files(root: Path, explicit_paths: list[str] | None = None) -> li
     Skips: gen/, thirdparty/, godot-cpp/, and other SKIP_DIRS.
     """
     if explicit_paths:
-        return [Path(p) for p in explicit_paths if Path(p).exists()]
+        return [p for p in map(Path, explicit_paths) if p.exists()]
 
     files: list[Path] = []
 
     for directory in [SRC_DIR, DEMO_DIR]:
-        dir_path = root / directory
-        if not dir_path.exists():
-            continue
-        for p in sorted(dir_path.rglob("*")):
-            if not p.is_file():
-                continue
-            if p.name in SKIP_FILES:
-                continue
-            if any(skip in p.parts for skip in SKIP_DIRS):
-                continue
-            if p.suffix in (".h", ".cpp", ".gd"):
-                # Skip auto-generated files.
-                if any(p.name.endswith(sfx) for sfx in SKIP_SUFFIXES):
-                    continue
-                files.append(p)
+        # The walk skips a missing root itself; no stat beforehand.
+        _walk_source_dir(os.path.join(root, directory), files)
 
     return files
 
@@ -717,74 +912,308 @@ def find_source_files(root: Path, explicit_paths: list[str] | None = None) -> li
 #  LINT ENGINE
 # ══════════════════════════════════════════════════════════════════════
 
+# Shared stand-in for "no suppressions"; never mutated.
+_NO_RULES: frozenset[str] = frozenset()
+
+
+def _applicable_checks(rel_path: str, rule_filter: Optional[str]) -> list:
+    """The checks selected by rule_filter that run on rel_path's suffix."""
+    return [
+        check_fn
+        for family, family_checks in RULE_CHECKS.items()
+        if not rule_filter or family.startswith(rule_filter)
+        for check_fn in family_checks
+        if rel_path.endswith(check_fn.suffixes)
+    ]
+
+
 def lint_file(
     path: Path,
-    root: Path,
+    rel_path: str,
     rule_filter: Optional[str],
     file_suppressions: dict[str, set[str]],
+    data: Optional[bytes] = None,
 ) -> tuple[list[Violation], int]:
     """Run all applicable rules on a single file.
 
-    Returns (violations, suppressed_count).
+    rel_path is the root-relative, forward-slash path reported in violations
+    and matched against lint.conf.  data, if given, is the file's contents
+    already read by the caller.  Returns (violations, suppressed_count).
     """
-    try:
-        text = path.read_text(encoding="utf-8", errors="replace")
-    except (OSError, UnicodeDecodeError):
+    checks = _applicable_checks(rel_path, rule_filter)
+    # No rule applies (e.g. .gd demos): skip the read and decode entirely.
+    if not checks:
         return [], 0
 
-    lines = text.splitlines()
-    rel_path = str(path.relative_to(root)).replace("\\", "/")
+    # Read raw bytes and decode once: skips the TextIOWrapper layer and its
+    # newline translation, which splitlines() makes redundant.
+    if data is None:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return [], 0
+    text = data.decode("utf-8", errors="replace")
+
+    heads = [check_fn.head for check_fn in checks]
+    if None in heads:
+        lines = text.splitlines()
+    else:
+        # Only leading lines are read (e.g. --rule header): skip splitting
+        # the body.  Suppressions beyond these lines cannot apply either.
+        lines = _leading_lines(text, max(heads))
 
-    # Collect inline suppressions (line → set of rules).
+    # Collect inline suppressions (line → set of rules).  Markers are rare:
+    # a substring test skips the whole scan for most files, and gates the
+    # regex per line for the rest.
     inline_suppressions: dict[int, set[str]] = {}
-    for i, line in enumerate(lines):
-        m = _SUPPRESS_RE.search(line)
-        if m:
-            # Suppression applies to the current line AND the next line.
-            rule = m.group(1)
-            inline_suppressions.setdefault(i, set()).add(rule)
-            inline_suppressions.setdefault(i + 1, set()).add(rule)
+    if "rt-lint" in text:
+        for i, line in enumerate(lines):
+            if "rt-lint" not in line:
+                continue
+            m = _SUPPRESS_RE.search(line)
+            if m:
+                # Suppression applies to the current line AND the next line.
+                rule = m.group(1)
+                inline_suppressions.setdefault(i, set()).add(rule)
+                inline_suppressions.setdefault(i + 1, set()).add(rule)
 
     # File-level suppressions from lint.conf.
-    file_rules = file_suppressions.get(rel_path, set())
+    file_rules = file_suppressions.get(rel_path, _NO_RULES)
 
-    # Run checks.
+    # Run checks.  Each gets the lines plus their "\n"-joined text, built
+    # once per file.  The join (rather than the raw file text) keeps offsets
+    # in step with splitlines(), which also breaks on \r, \f, etc.
     all_violations: list[Violation] = []
     suppressed = 0
+    full_text = "\n".join(lines)
 
-    for family, checks in RULE_CHECKS.items():
-        if rule_filter and not family.startswith(rule_filter):
+    for check_fn in checks:
+        raw = check_fn(rel_path, lines, full_text)
+        # Most files suppress nothing: keep every violation without
+        # testing each one.
+        if not inline_suppressions and not file_rules:
+            all_violations.extend(raw)
             continue
-        for check_fn in checks:
-            raw = check_fn(rel_path, lines)
-            for v in raw:
-                # Check suppression.
-                line_idx = v.line - 1  # 0-based for inline_suppressions
-                line_supp = inline_suppressions.get(line_idx, set())
-                # Match exact rule or family prefix.
-                if (v.rule in line_supp
-                    or v.rule.split("/")[0] in line_supp
-                    or v.rule in file_rules
-                    or v.rule.split("/")[0] in file_rules):
-                    suppressed += 1
-                    continue
-                all_violations.append(v)
+        for v in raw:
+            # Check suppression.
+            line_idx = v.line - 1  # 0-based for inline_suppressions
+            line_supp = inline_suppressions.get(line_idx, _NO_RULES)
+            # Match exact rule or family prefix.
+            if (v.rule in line_supp
+                or v.rule.split("/")[0] in line_supp
+                or v.rule in file_rules
+                or v.rule.split("/")[0] in file_rules):
+                suppressed += 1
+                continue
+            all_violations.append(v)
 
     return all_violations, suppressed
 
 
+def _lint_file_rows(
+    lint, path: Path, rel_path: str, data: Optional[bytes],
+) -> tuple[list[tuple], int]:
+    """Pool worker: lint_file() with violations as plain field tuples.
+
+    Tuples of builtins pickle several times faster and smaller than
+    dataclass instances; the parent rebuilds each Violation with rel_path,
+    which it already holds.
+    """
+    violations, suppressed = lint(path, rel_path, data=data)
+    return [(v.line, v.rule, v.message, v.severity) for v in violations], suppressed
+
+
+def _leading_lines(text: str, count: int) -> list[str]:
+    """Return text.splitlines()[:count] without splitting all of text.
+
+    Splits growing prefixes until one yields more than count lines: every
+    line followed by another inside the prefix has its full terminator
+    there, so those lines match a split of the whole text.
+    """
+    size = 256
+    while size < len(text):
+        parts = text[:size].splitlines()
+        if len(parts) > count:
+            return parts[:count]
+        size *= 4
+    return text.splitlines()[:count]
+
+
+def _rel_path(path: Path, root_prefix: str) -> str:
+    """Root-relative, forward-slash form of path.
+
+    root_prefix is str(root) with a trailing separator.  Discovered files
+    always start with it, so a string slice replaces Path.relative_to();
+    anything else falls back to relative_to() (and its ValueError).
+    """
+    text = str(path)
+    if text.startswith(root_prefix):
+        rel = text[len(root_prefix):]
+        return rel if os.sep == "/" else rel.replace(os.sep, "/")
+    return path.relative_to(root_prefix).as_posix()
+
+
+def _cache_key(
+    data: bytes,
+    rel_path: str,
+    rule_filter: Optional[str],
+    file_rules: AbstractSet[str],
+) -> str:
+    """Hash everything a file's lint result depends on."""
+    h = hashlib.blake2b(_LINT_DIGEST, digest_size=16)
+    h.update(repr((rel_path, rule_filter, sorted(file_rules))).encode())
+    h.update(data)
+    return h.hexdigest()
+
+
+def _load_cache(cache_path: Path) -> dict:
+    """Load the results cache; a missing or corrupt file is an empty cache.
+
+    Only the top-level type is checked here; run_lint replaces a malformed
+    filter section, and validates each entry it looks up with
+    _valid_cache_entry(), treating a bad one as a miss.
+    """
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _valid_cache_entry(entry) -> bool:
+    """Whether a loaded entry has the shape run_lint stores:
+    [key, suppressed, [[line, rule, message, severity], ...]]."""
+    return (
+        isinstance(entry, list) and len(entry) == 3
+        and isinstance(entry[0], str) and isinstance(entry[1], int)
+        and isinstance(entry[2], list)
+        and all(
+            isinstance(row, list) and len(row) == 4
+            and isinstance(row[0], int) and isinstance(row[1], str)
+            and isinstance(row[2], str) and isinstance(row[3], str)
+            for row in entry[2]
+        )
+    )
+
+
+def _save_cache(cache_path: Path, cache: dict) -> None:
+    """Write the results cache atomically; failures only cost a cold run."""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(cache, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
 def run_lint(
     root: Path,
     files: list[Path],
     rule_filter: Optional[str] = None,
     verbose: bool = False,
+    jobs: int = 1,
+    cache_path: Optional[Path] = None,
+    prune_cache: bool = False,
 ) -> LintStats:
-    """Run the linter on all given files and return stats."""
+    """Run the linter on all given files and return stats.
+
+    With jobs > 1, files are linted in a process pool.  Results are consumed
+    in input order, so output is identical to a serial run.  With cache_path,
+    files whose cache key is unchanged reuse their stored result and only
+    the rest are linted.
+
+    Fresh results are merged into the cache under this run's rule filter;
+    entries for other files and other filters are kept, so linting a few
+    explicit paths or one --rule family leaves the full-run results intact.
+    Pass prune_cache only when files is the full discovery: entries for
+    paths that are neither among them nor on disk are then dropped.
+    """
     stats = LintStats()
     file_suppressions = _load_file_suppressions(root)
+    lint = functools.partial(
+        lint_file, rule_filter=rule_filter,
+        file_suppressions=file_suppressions,
+    )
+    # Relative paths are computed once per file, here, and reused for the
+    # checks, lint.conf lookup and verbose output.  Checks receive the
+    # normalized path and never re-normalize it.
+    root_prefix = os.path.join(str(root), "")
+    rel_paths = [_rel_path(path, root_prefix) for path in files]
+
+    results: list[Optional[tuple[list[Violation], int]]] = [None] * len(files)
+    cache = _load_cache(cache_path) if cache_path else {}
+    # One section per rule filter ("" = all rules).
+    section = cache.get(rule_filter or "")
+    if not isinstance(section, dict):
+        section = cache[rule_filter or ""] = {}
+    cache_changed = False
+    keys: list[Optional[str]] = [None] * len(files)
+    # Bytes read for hashing are handed to the lint step: one read per file.
+    contents: list[Optional[bytes]] = [None] * len(files)
+    for i, rel in enumerate(rel_paths):
+        # No selected check applies: the result is known without reading.
+        if not _applicable_checks(rel, rule_filter):
+            results[i] = ([], 0)
+            continue
+        if not cache_path:
+            continue
+        try:
+            data = files[i].read_bytes()
+        except OSError:
+            continue  # lint_file reports nothing for an unreadable file
+        contents[i] = data
+        keys[i] = key = _cache_key(data, rel, rule_filter, file_suppressions.get(rel, _NO_RULES))
+        entry = section.get(rel)
+        if _valid_cache_entry(entry) and entry[0] == key:
+            results[i] = ([Violation(rel, *v) for v in entry[2]], entry[1])
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    pending_files = [files[i] for i in pending]
+    pending_rels = [rel_paths[i] for i in pending]
+    pending_data = [contents[i] for i in pending]
+    workers = min(jobs, len(pending) // MIN_FILES_PER_WORKER)
+    if workers > 1:
+        chunksize = max(1, len(pending) // (workers * 4))
+        rows = functools.partial(_lint_file_rows, lint)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fresh = [
+                ([Violation(rel, *row) for row in file_rows], suppressed)
+                for rel, (file_rows, suppressed) in zip(
+                    pending_rels,
+                    pool.map(rows, pending_files, pending_rels, pending_data,
+                             chunksize=chunksize),
+                )
+            ]
+    else:
+        fresh = (
+            lint(path, rel, data=data)
+            for path, rel, data in zip(pending_files, pending_rels, pending_data)
+        )
 
-    for path in files:
-        violations, suppressed = lint_file(path, root, rule_filter, file_suppressions)
+    for i, result in zip(pending, fresh):
+        results[i] = result
+        if keys[i] is not None:
+            violations, suppressed = result
+            section[rel_paths[i]] = [keys[i], suppressed, [
+                [v.line, v.rule, v.message, v.severity] for v in violations
+            ]]
+            cache_changed = True
+    if cache_path and prune_cache:
+        # Only entries missing from this run need a stat; a file that still
+        # exists (e.g. now unreadable) keeps its entry.
+        current = set(rel_paths)
+        for filter_section in cache.values():
+            if not isinstance(filter_section, dict):
+                continue
+            stale = [rel for rel in filter_section
+                     if rel not in current and not (root / rel).exists()]
+            for rel in stale:
+                del filter_section[rel]
+            cache_changed = cache_changed or bool(stale)
+    if cache_path and cache_changed:
+        _save_cache(cache_path, cache)
+
+    for rel, (violations, suppressed) in zip(rel_paths, results):
         stats.files_checked += 1
         stats.suppressed += suppressed
 
@@ -794,7 +1223,6 @@ def run_lint(
             stats.files_passed += 1
 
         if verbose and not violations:
-            rel = path.relative_to(root)
             print(f"  ✓ {rel}")
 
     return stats
@@ -804,11 +1232,26 @@ def run_lint(
 #  CLI
 # ══════════════════════════════════════════════════════════════════════
 
-def _color(text: str, code: str) -> str:
-    """ANSI color wrapper (no-op if not a TTY)."""
-    if not sys.stdout.isatty():
+def _usable_cpus() -> int:
+    """CPUs this process may run on (CI containers often get fewer than
+    os.cpu_count() reports)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+# Checked once: stdout does not change between colored tokens.  A non-empty
+# NO_COLOR (https://no-color.org) turns coloring off even on a terminal.
+_USE_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+if _USE_COLOR:
+    def _color(text: str, code: str) -> str:
+        """ANSI color wrapper."""
+        return f"\033[{code}m{text}\033[0m"
+else:
+    def _color(text: str, code: str) -> str:
+        """No-op color wrapper: stdout is not a TTY, or NO_COLOR is set."""
         return text
-    return f"\033[{code}m{text}\033[0m"
 
 
 def main() -> int:
@@ -837,6 +1280,8 @@ def main() -> int:
               python tools/lint.py --rule godot-native    # only Godot-Native rules
               python tools/lint.py --summary              # rule-by-rule counts
               python tools/lint.py src/core/ray.h         # specific file
+              python tools/lint.py -j 4                   # 4 worker processes (-j 1 = serial)
+              python tools/lint.py --no-cache             # ignore tools/.lintcache
         """),
     )
     parser.add_argument(
@@ -855,6 +1300,14 @@ def main() -> int:
         "--verbose", "-v", action="store_true",
         help="Show passing files too",
     )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None,
+        help="Worker processes (default: usable CPUs; 1 = serial)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Lint every file, ignoring and not updating {CACHE_FILE}",
+    )
     parser.add_argument(
         "--root", type=str, default=None,
         help="Project root directory (auto-detected if not specified)",
@@ -864,10 +1317,10 @@ def main() -> int:
 
     # Auto-detect project root.
     if args.root:
-        root = Path(args.root).resolve()
+        root = Path(os.path.realpath(args.root))
     else:
         # Walk up from this script to find SConstruct.
-        candidate = Path(__file__).resolve().parent.parent
+        candidate = Path(os.path.realpath(__file__)).parent.parent
         if (candidate / "SConstruct").exists():
             root = candidate
         else:
@@ -876,12 +1329,8 @@ def main() -> int:
     # Resolve explicit file paths relative to root.
     explicit = None
     if args.files:
-        explicit = []
-        for f in args.files:
-            p = Path(f)
-            if not p.is_absolute():
-                p = root / p
-            explicit.append(str(p.resolve()))
+        # realpath() on strings: join() keeps absolute paths as they are.
+        explicit = [os.path.realpath(os.path.join(root, f)) for f in args.files]
 
     # Find files.
     files = find_source_files(root, explicit)
@@ -895,13 +1344,20 @@ def main() -> int:
         print(_color(f"Unknown rule family '{args.rule}'. Valid: {valid}", "31"))
         return 2
 
+    jobs = args.jobs if args.jobs is not None else _usable_cpus()
+    if jobs < 1:
+        print(_color(f"--jobs must be at least 1 (got {jobs})", "31"))
+        return 2
+
     # Run.
     print(f"Linting {len(files)} files", end="")
     if args.rule:
         print(f" (rule: {args.rule})", end="")
     print(f" ...")
 
-    stats = run_lint(root, files, args.rule, args.verbose)
+    cache_path = None if args.no_cache else root / CACHE_FILE
+    stats = run_lint(root, files, args.rule, args.verbose, jobs, cache_path,
+                     prune_cache=not args.files)
 
     # Output.
     if args.summary:
@@ -910,17 +1366,17 @@ def main() -> int:
         _print_details(stats, root)
 
     # Final status.
-    print()
-    if stats.violations:
-        print(_color(
-            f"✖ {len(stats.violations)} violation(s) in {stats.files_failed} file(s)"
+    nviol = len(stats.violations)
+    if nviol:
+        print("\n" + _color(
+            f"✖ {nviol} violation(s) in {stats.files_failed} file(s)"
             f" ({stats.files_passed}/{stats.files_checked} passed"
             f", {stats.suppressed} suppressed)",
             "31"
         ))
         return 1
     else:
-        print(_color(
+        print("\n" + _color(
             f"✓ All {stats.files_checked} files pass"
             f" ({stats.suppressed} suppressed)",
             "32"
@@ -928,20 +1384,48 @@ def main() -> int:
         return 0
 
 
+# Colored severity labels, built once rather than per violation.  Anything
+# other than "error" is shown in warning yellow.
+_SEVERITY_LABELS = {
+    "error": _color("ERROR", "31"),
+    "warning": _color("WARNING", "33"),
+}
+
+# Sort key for violations within a file.
+_BY_LINE = attrgetter("line")
+
+# One violation line in the details listing: line, severity, message, rule.
+_DETAIL_FMT = "  {:4d}: {}: {}  [{}]".format
+
+
 def _print_details(stats: LintStats, root: Path) -> None:
     """Print per-file violation details."""
     # Group by file.
-    by_file: dict[str, list[Violation]] = {}
+    by_file: dict[str, list[Violation]] = defaultdict(list)
     for v in stats.violations:
-        by_file.setdefault(v.file, []).append(v)
-
-    for filepath in sorted(by_file.keys()):
+        by_file[v.file].append(v)
+
+    # Lines are collected and written at once: one write instead of a
+    # print() per violation.
+    out: list[str] = []
+    # A run reports a few dozen rules at most: color each name once.
+    rule_labels: dict[str, str] = {}
+    for filepath in sorted(by_file):
         violations = by_file[filepath]
-        print(f"\n{_color(filepath, '1')}")
-        for v in sorted(violations, key=lambda x: x.line):
-            sev_color = "31" if v.severity == "error" else "33"
-            print(f"  {v.line:4d}: {_color(v.severity.upper(), sev_color)}: "
-                  f"{v.message}  [{_color(v.rule, '36')}]")
+        # Each check emits in line order, so this merges a few ascending
+        # runs (near-linear for timsort); in place, as the list is ours.
+        violations.sort(key=_BY_LINE)
+        out.append(f"\n{_color(filepath, '1')}")
+        for v in violations:
+            severity = _SEVERITY_LABELS.get(v.severity)
+            if severity is None:
+                severity = _color(v.severity.upper(), "33")
+            rule = rule_labels.get(v.rule)
+            if rule is None:
+                rule = rule_labels[v.rule] = _color(v.rule, "36")
+            out.append(_DETAIL_FMT(v.line, severity, v.message, rule))
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 def _print_summary(stats: LintStats) -> None:
@@ -950,16 +1434,19 @@ def _print_summary(stats: LintStats) -> None:
     if not counts:
         return
 
-    max_rule = max(len(r) for r in counts.keys())
-    print(f"\n{'Rule':<{max_rule}}  Count")
-    print(f"{'─' * max_rule}  ─────")
+    max_rule = max(map(len, counts))
+    out = [
+        f"\n{'Rule':<{max_rule}}  Count",
+        f"{'─' * max_rule}  ─────",
+    ]
+    # Every counted rule has at least one violation, so every count is red.
     for rule, count in counts.items():
-        color = "31" if count > 0 else "32"
-        print(f"{rule:<{max_rule}}  {_color(str(count), color)}")
+        out.append(f"{rule:<{max_rule}}  {_color(str(count), '31')}")
 
-    print(f"\n{'Total':<{max_rule}}  {_color(str(len(stats.violations)), '31')}")
+    out.append(f"\n{'Total':<{max_rule}}  {_color(str(len(stats.violations)), '31')}")
     if stats.suppressed:
-        print(f"{'Suppressed':<{max_rule}}  {stats.suppressed}")
+        out.append(f"{'Suppressed':<{max_rule}}  {stats.suppressed}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":